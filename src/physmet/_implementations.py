@@ -359,6 +359,10 @@ def object_dunder_pow(
     mod: int=None,
 ) -> ObjectType:
     """Compute a ** b."""
+    if type(b) is int and isinstance(a, Scalar):
+        # Fast path for the common case of a scalar raised to an integral
+        # power, which avoids the structural protocol check below.
+        return scalar_factory(pow(a.data, b, mod=mod), pow(a.unit, b))
     if isinstance(b, numeric.Measurement) and not b.isunitless:
         raise ValueError(
             "Cannot compute a ** b unless b is unitless"
@@ -594,9 +598,14 @@ def cumsum(x: Object[numeric.RealValueType], **kwargs):
 @implement(numpy.transpose)
 def array_transpose(x: Object[numeric.RealValueType], **kwargs):
     """Compute the transpose of `x`."""
-    data = numpy.transpose(x.data, **kwargs)
     if isinstance(x, Scalar):
-        return scalar_factory(numpy.ravel(data)[0], unit=x.unit)
+        # The transpose of a scalar is the scalar itself, so there is no need
+        # to round-trip its value through a 0-D array. Keyword arguments still
+        # go to `numpy`, which will reject `axes` that are invalid for 0-D data.
+        if kwargs:
+            numpy.transpose(x.data, **kwargs)
+        return scalar_factory(x.data, unit=x.unit)
+    data = numpy.transpose(x.data, **kwargs)
     metadata = {'unit': x.unit}
     if isinstance(x, Array):
         metadata['axes'] = {d: x.axes[d] for d in data.dimensions}
@@ -789,7 +798,7 @@ def vector_dunder_getitem(a: Object, i, /):
 @require_object
 def tensor_dunder_iter(a: Object):
     """Called for iter(a)."""
-    return _generate_scalars(numpy.array(a.data).flat, a.unit)
+    return _generate_scalars(numpy.asarray(a.data).flat, a.unit)
 
 
 @require_object
@@ -915,11 +924,18 @@ SCALAR_OPERATORS = {
 }
 
 
+_ScalarType = type('Scalar', (Scalar,), SCALAR_OPERATORS)
+"""The concrete scalar type.
+
+Every arithmetic operation on scalars creates a new instance, so building this
+class once avoids creating a new class per result.
+"""
+
+
 def scalar_factory(x, unit=None):
     """Create a new scalar."""
-    Type = type('Scalar', (Scalar,), SCALAR_OPERATORS)
     d, u = scalar_args(x, unit)
-    return Type(d, unit=metric.unit(u or '1'))
+    return _ScalarType(d, unit=metric.unit(u or '1'))
 
 
 def scalar_args(x, unit, /):
@@ -957,11 +973,22 @@ VECTOR_OPERATORS = {
 }
 
 
+_VectorType = type(
+    'Vector',
+    (Vector, collections.abc.Sequence),
+    VECTOR_OPERATORS,
+)
+"""The concrete vector type.
+
+Building this class once avoids creating a new class, with its abstract-base
+bookkeeping, on every call to `~vector_factory`.
+"""
+
+
 def vector_factory(data, unit=None):
     """Create a new vector."""
-    Type = type('Vector', (Vector, collections.abc.Sequence), VECTOR_OPERATORS)
     d, u = vector_args(data, unit)
-    return Type(d, unit=metric.unit(u or '1'))
+    return _VectorType(d, unit=metric.unit(u or '1'))
 
 
 def vector_args(x, unit, /):
@@ -998,15 +1025,34 @@ TENSOR_OPERATORS = {
 }
 
 
+_TensorType = type(
+    'Tensor',
+    (Tensor, collections.abc.Sequence),
+    TENSOR_OPERATORS,
+)
+"""The concrete tensor type.
+
+Building this class once avoids creating a new class, with its abstract-base
+bookkeeping, on every call to `~tensor_factory`.
+"""
+
+
 def tensor_factory(data, unit=None):
     """Create a new tensor."""
-    Type = type('Tensor', (Tensor, collections.abc.Sequence), TENSOR_OPERATORS)
+    if type(data) is _TensorType and unit is None:
+        # A tensor is immutable at this level, so the new instance can share
+        # the data and unit of the existing one.
+        return _TensorType(data.data, unit=data.unit)
     d, u = tensor_args(data, unit)
-    return Type(d, unit=metric.unit(u or '1'))
+    return _TensorType(d, unit=metric.unit(u or '1'))
 
 
 def tensor_args(x, unit, /):
     """Parse arguments to initialize `~Tensor`."""
+    if type(x) is numpy.ndarray and x.ndim > 0:
+        # Results of `numpy` functions on tensor data take this path, which
+        # avoids the instance checks against measurable types below.
+        return x, unit
     if isinstance(x, Object) and unit is not None:
         raise ValueError(
             "Cannot change unit via object creation"
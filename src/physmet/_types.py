@@ -81,7 +81,9 @@ class Tensor(Object[base.ArrayType]):
         data: base.ArrayType,
         unit: str | metric.Unit,
     ) -> None:
-        if not isinstance(data, base.Array):
+        # Checking for `numpy.ndarray` first avoids the slower structural check
+        # of the runtime-checkable protocol in the most common case.
+        if not isinstance(data, (numpy.ndarray, base.Array)):
             raise TypeError(
                 f"Data argument to {type(self)} must implement"
                 f" the {base.Array} protocol"
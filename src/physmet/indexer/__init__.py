@@ -1,3 +1,4 @@
+import functools
 import typing
 
 import numpy
@@ -186,12 +187,14 @@ def normalize(shape: typing.Sequence[int], args):
     indices = []
     for i, arg in enumerate(expanded):
         if isinstance(arg, slice):
-            indices.append(range(shape[i]))
+            # Build the full range in C rather than converting a Python range
+            # element by element.
+            indices.append(numpy.arange(shape[i]))
         elif quantity.isintegral(arg):
             indices.append((arg,))
         else:
             indices.append(arg)
-    return numpy.ix_(*list(indices))
+    return numpy.ix_(*indices)
 
 
 def _normalized(args):
@@ -205,6 +208,33 @@ def _normalized(args):
 
 def expand(ndim: int, indices):
     """Expand `indices` so that they will index `ndim` dimensions."""
+    if _cacheable(indices):
+        return _expand_cached(ndim, indices)
+    return _expand(ndim, indices)
+
+
+def _cacheable(indices) -> bool:
+    """True if `~expand` may cache its result for `indices`.
+
+    Notes
+    -----
+    This function only accepts built-in integers and `Ellipsis`, since other
+    index types may be unhashable (e.g., lists, arrays, or slices before Python
+    3.12) or may compare equal to an integer with different meaning as an index
+    (e.g., `True == 1`).
+    """
+    items = indices if isinstance(indices, tuple) else (indices,)
+    return all(type(i) is int or i is Ellipsis for i in items)
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_cached(ndim: int, indices):
+    """Cached version of `~_expand`."""
+    return _expand(ndim, indices)
+
+
+def _expand(ndim: int, indices):
+    """Helper for `~expand`."""
     if isinstance(indices, (list, tuple)):
         return expand_ellipsis(ndim, *indices)
     if indices == slice(None):
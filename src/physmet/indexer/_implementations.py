@@ -233,6 +233,11 @@ def arithmetic(
 
 def arithmetic(f, a, b, **kwargs):
     """Implement a binary arithmetic operation on indexer types."""
+    if _isfastoperand(a) and _isfastoperand(b):
+        if type(a) is _ValueType or type(b) is _ValueType:
+            x = a.data if type(a) is _ValueType else a
+            y = b.data if type(b) is _ValueType else b
+            return _new_or_result(value_factory, f(x, y, **kwargs))
     r = binary(f, a, b, **kwargs)
     if isinstance(a, numeric.Indexer) and isinstance(b, numeric.Indexer):
         if all(isinstance(i, _types.Value) for i in (a, b)):
@@ -251,6 +256,16 @@ def arithmetic(f, a, b, **kwargs):
     raise OperandTypeError(a, b)
 
 
+def _isfastoperand(x) -> bool:
+    """True if `x` is an index value or a built-in integer.
+
+    Arithmetic on these operands does not need the protocol-based instance
+    checks in `binary` and `arithmetic`, which dominate the cost of operating
+    on small integers.
+    """
+    return type(x) is _ValueType or type(x) is int
+
+
 def binary(f, a, b, **kwargs):
     """Compute f(a, b, **kwargs) on index data."""
     if isinstance(a, _types.Sequence) and isinstance(b, _types.Sequence):
@@ -342,12 +357,15 @@ def __index__(a: _types.Value) -> int:
 
 def indices_shift(a: _types.Sequence, __x: I, floor: I=None, ceil: I=None):
     """Shift indices by a constant value."""
-    indices = numpy.array(a.data) + int(__x)
-    if floor is not None:
-        indices[indices < floor] = floor
-    if ceil is not None:
-        indices[indices > ceil] = ceil
-    return sequence_factory(indices)
+    indices = numpy.asarray(a.data) + int(__x)
+    if floor is not None or ceil is not None:
+        # Coerce the bounds, like the shift, so that clipping in place on the
+        # integral array does not require casting.
+        lower = None if floor is None else int(floor)
+        upper = None if ceil is None else int(ceil)
+        numpy.clip(indices, lower, upper, out=indices)
+    # The shifted array is new and integral, so it needs no parsing or copy.
+    return _sequence_factory(indices)
 
 
 def __iter__(a: _types.Sequence):
@@ -381,6 +399,9 @@ def value_str(a: _types.Value):
 
 def value_factory(x, /):
     """Create a single numeric index value."""
+    if type(x) is int or isinstance(x, numpy.integer):
+        # Integers are by far the most common argument and need no parsing.
+        return _value_factory(int(x))
     parsed = index_args(x)
     if isinstance(parsed, typing.SupportsInt):
         if isinstance(parsed, numpy.ndarray) and parsed.size == 1:
@@ -402,15 +423,22 @@ VALUE_OPERATORS = {
 }
 
 
+_ValueType = type('Value', (_types.Value,), VALUE_OPERATORS)
+"""The concrete index-value type."""
+
+
 def _value_factory(data):
     """Create a new index value."""
-    Type = type('Value', (_types.Value,), VALUE_OPERATORS)
-    return Type(data)
+    return _ValueType(data)
 
 
 def sequence_factory(x, /):
     """Create a sequence of numeric index values."""
     parsed = indices_args(x)
+    if isinstance(parsed, numpy.ndarray) and parsed.dtype.kind in 'iu':
+        # Integral arrays don't need per-element checks. Always copy, since
+        # even a read-only array may share memory with a writable one.
+        return _sequence_factory(numpy.array(parsed, dtype=int))
     if all(isinstance(i, typing.SupportsInt) for i in parsed):
         return _sequence_factory(numpy.array(parsed, dtype=int))
     raise TypeError(
@@ -439,10 +467,13 @@ SEQUENCE_OPERATORS = {
 }
 
 
+_SequenceType = type('Sequence', (_types.Sequence,), SEQUENCE_OPERATORS)
+"""The concrete index-sequence type."""
+
+
 def _sequence_factory(data):
     """Create a new index sequence."""
-    Type = type('Sequence', (_types.Sequence,), SEQUENCE_OPERATORS)
-    return Type(data)
+    return _SequenceType(data)
 
 
 def index_args(x, /):
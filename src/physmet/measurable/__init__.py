@@ -1,5 +1,5 @@
-import contextlib
 import numbers
+import re
 import typing
 import typing_extensions
 
@@ -220,13 +220,30 @@ def measure(*args, **kwargs):
     if not args:
         raise MeasuringTypeError("There is nothing to measure") from None
     this = args[0]
-    if isinstance(this, numeric.Measurement):
+    if _ismeasurement(this):
         return this
     if isinstance(this, numeric.Measurable):
         return _measure_explicit(this, **kwargs)
     return _measure_implicit(args)
 
 
+def _ismeasurement(x) -> bool:
+    """True if `x` is an instance of `~numeric.Measurement`.
+
+    Notes
+    -----
+    This function first checks whether the type of `x` explicitly derives from
+    `~numeric.Measurement`, which is true of every measured type in this
+    package. Doing so avoids the structural check of the runtime-checkable
+    protocol, which evaluates every protocol attribute on `x` (including the
+    `isunitless` property, which compares units).
+    """
+    return (
+        numeric.Measurement in type(x).__mro__
+        or isinstance(x, numeric.Measurement)
+    )
+
+
 def _measure_explicit(x: numeric.Measurable, **kwargs):
     """Create a measurement by calling `x.__measure__`."""
     result = x.__measure__(**kwargs)
@@ -392,19 +409,14 @@ def parse(x, /, distribute: bool=False):
         # there is nothing we can do to salvage it.
         raise ParsingValueError(errmsg) from None
     if counted[str] > 1:
-        # First, check for a single numeric string.
-        if isinstance(unwrapped, str):
-            with contextlib.suppress(ValueError):
-                return parse([float(unwrapped)])
-        # Next, check for all numeric strings.
-        with contextlib.suppress(ValueError):
+        # First, check for all numeric strings.
+        if all(_isnumeric(arg) for arg in unwrapped):
             return parse([float(arg) for arg in unwrapped])
-        # Finally, check for numeric strings with a final unit.
-        try:
+        # Next, check for numeric strings with a final unit.
+        if all(_isnumeric(arg) for arg in unwrapped[:-1]):
             values = [float(arg) for arg in unwrapped[:-1]]
-        except ValueError as err:
-            raise ParsingValueError(errmsg) from err
-        return parse([*values, unwrapped[-1]])
+            return parse([*values, unwrapped[-1]])
+        raise ParsingValueError(errmsg) from None
 
     # Handle flat numerical iterables, like (1.1,) or (1.1, 2.3).
     if all(isinstance(arg, numbers.Real) for arg in unwrapped):
@@ -434,6 +446,53 @@ def parse(x, /, distribute: bool=False):
     raise ParsingTypeError(x)
 
 
+_NUMERIC_CANDIDATE = re.compile(r'\d|inf|nan', re.IGNORECASE)
+"""Pattern that every string representation of a real number must contain."""
+
+
+def _isnumeric(arg) -> bool:
+    """True if `arg` is a real number or a string that represents one.
+
+    Notes
+    -----
+    Strings without a digit or a spelling of infinity or NaN cannot represent
+    a real number, so this function rejects them without attempting the
+    conversion. For any other string, `float` makes the final decision.
+    """
+    if isinstance(arg, str):
+        if not _NUMERIC_CANDIDATE.search(arg):
+            return False
+        try:
+            float(arg)
+        except ValueError:
+            return False
+        return True
+    return isinstance(arg, numbers.Real)
+
+
+def _parse_flat_items(unwrapped):
+    """Parse items of the form `(v0, v1, ..., unit)` with a common unit.
+
+    This is a helper for `~_recursive_parse` that handles the common case of a
+    collection of flat measurables in a single pass. It returns the combined
+    numeric values and the unit if every item has that form, and `None`
+    otherwise, so the caller can fall back to parsing each item individually.
+    """
+    unit = None
+    values = []
+    for item in unwrapped:
+        if len(item) < 2 or not isinstance(item[-1], str):
+            return
+        if unit is None:
+            unit = item[-1]
+        elif item[-1] != unit:
+            return
+        if not all(isinstance(v, numbers.Real) for v in item[:-1]):
+            return
+        values.extend(item[:-1])
+    return values, unit
+
+
 def _wrap_measurable(values, unit, distribute: bool):
     """Wrap a parsed measurable and return to caller."""
     if distribute:
@@ -443,6 +502,8 @@ def _wrap_measurable(values, unit, distribute: bool):
 
 def _recursive_parse(unwrapped, distribute: bool):
     """Parse the measurable by calling back to `~parse`."""
+    if flat := _parse_flat_items(unwrapped):
+        return _wrap_measurable(*flat, distribute)
     if distribute:
         parsed = [
             item
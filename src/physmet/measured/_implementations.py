@@ -47,11 +47,14 @@ VALUE_OPERATORS = {
 }
 
 
+_ValueType = type('Value', (Value,), VALUE_OPERATORS)
+"""The concrete measured-value type."""
+
+
 def value_factory(x, /, unit=None) -> Value:
     """Create a new measured value."""
-    Type = type('Value', (Value,), VALUE_OPERATORS)
     d, u = value_args(x, unit)
-    return Type(d, metric.unit(u or '1'))
+    return _ValueType(d, metric.unit(u or '1'))
 
 
 def value_args(x, unit, /) -> typing.Tuple[typing.Any, metric.Unit]:
@@ -128,15 +131,22 @@ SEQUENCE_OPERATORS = {
 }
 
 
+_SequenceType = type('Sequence', (Sequence,), SEQUENCE_OPERATORS)
+"""The concrete measured-sequence type."""
+
+
 def sequence_factory(x, /, unit=None) -> Sequence:
     """Create a new measured sequence."""
-    Type = type('Sequence', (Sequence,), SEQUENCE_OPERATORS)
     d, u = sequence_args(x, unit)
-    return Type(d, metric.unit(u or '1'))
+    return _SequenceType(d, metric.unit(u or '1'))
 
 
 def sequence_args(x, unit, /) -> typing.Tuple[typing.Any, metric.Unit]:
     """Parse arguments to initialize `~Sequence`."""
+    if isinstance(x, (list, tuple, numpy.ndarray)):
+        # Neither built-in sequences nor arrays can be measurements, so skip
+        # the comparatively slow protocol-based checks below.
+        return _sequence_array(x, unit)
     if isinstance(x, Sequence):
         if unit is None:
             return x.data, x.unit
@@ -150,6 +160,11 @@ def sequence_args(x, unit, /) -> typing.Tuple[typing.Any, metric.Unit]:
         return numpy.array(x.data, ndmin=1), x.unit
     if isinstance(x, numbers.Real):
         return numpy.array([x]), unit
+    return _sequence_array(x, unit)
+
+
+def _sequence_array(x, unit, /) -> typing.Tuple[numpy.ndarray, metric.Unit]:
+    """Helper for `sequence_args`."""
     a = numpy.asarray(x)
     if a.ndim > 0:
         return a.flatten(), unit
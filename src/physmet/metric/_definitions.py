@@ -49,6 +49,7 @@ class Unit(symbolic.Expression):
         self._dimensionless = None
         self._quantity = None
         self._norms = dict.fromkeys(_reference.SYSTEMS)
+        self._powers = {}
 
     def normalize(self, system: str, quantity: str=None):
         """Represent this unit in base units of `system`.
@@ -98,7 +99,16 @@ class Unit(symbolic.Expression):
         """Called for self ** other."""
         if not isinstance(other, numbers.Real):
             return NotImplemented
-        return unit_factory([term ** other for term in self])
+        if type(other) is not int:
+            return unit_factory([term ** other for term in self])
+        # Cache integral powers on this instance. Restricting the cache to
+        # built-in integers keeps equal keys like `2` and `2.0` from sharing
+        # results with different exponent types.
+        if (cached := self._powers.get(other)) is None:
+            cached = self._powers[other] = unit_factory(
+                [term ** other for term in self]
+            )
+        return cached
 
     def __rpow__(self, other):
         """Called for other ** self."""
@@ -424,8 +434,20 @@ def _decompose_term(term: symbolic.Term):
 _UNITS = aliasedkeys.MutableMapping()
 """Internal collection of singleton `~Unit` instances."""
 
+_STRING_UNITS: typing.Dict[str, Unit] = {}
+"""Cache of `~Unit` instances by the exact string that created them."""
+
 def unit_factory(arg: typing.Union[str, Unit]) -> Unit:
     """Create a metric unit representing the given expression."""
+    if isinstance(arg, str):
+        if (cached := _STRING_UNITS.get(arg)) is None:
+            cached = _STRING_UNITS[arg] = _create_unit(arg)
+        return cached
+    return _create_unit(arg)
+
+
+def _create_unit(arg: typing.Union[str, Unit]) -> Unit:
+    """Helper for `~unit_factory`."""
     if isinstance(arg, Unit):
         return arg
     # Attempt to extract a string representing a single unit.
@@ -9,12 +9,20 @@ from .. import metric
 from .. import symbolic
 
 
+_BUILTIN_CONTAINERS = (list, tuple, dict, set, frozenset)
+"""Built-in container types, which are null if and only if they are empty."""
+
+
 def isnull(this: typing.Any) -> bool:
     """True if `this` is empty but not if it's 0.
 
     This function allows the calling code to programmatically test for objects
     that are logically `False` except for numbers equivalent to 0.
     """
+    if this is None:
+        return True
+    if type(this) in _BUILTIN_CONTAINERS:
+        return not this
     if isinstance(this, numbers.Number):
         return False
     size = getattr(this, 'size', None)
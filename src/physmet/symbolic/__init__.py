@@ -2,6 +2,9 @@
 Support for working with symbolic algebraic terms and expressions.
 """
 
+import fractions
+import functools
+import re
 import typing
 
 from ._definitions import (
@@ -15,6 +18,7 @@ from ._definitions import (
     Term,
     asterms,
     expression_factory as expression,
+    parse_expression as _parse,
     reduce,
     standard,
     term_factory as term,
@@ -40,6 +44,18 @@ __all__ = [
 
 
 Expressable = typing.Union[str, typing.Iterable, Expression]
+"""Type alias for objects that can instantiate `~symbolic.Expression`.
+
+Notes
+-----
+This alias must exist at runtime because `~metric` uses it to define
+`~metric.UnitType` and `~metric.UnitLike`. Python evaluates it once, when it
+first imports this module.
+"""
+
+
+_OPERATORS = re.compile(r'[*/]')
+"""Pattern that matches a multiplication or division operator."""
 
 
 def composition(this):
@@ -57,28 +73,65 @@ def composition(this):
     """
     return (
         isinstance(this, Expression)
-        or isinstance(this, str) and ('/' in this or '*' in this)
+        or isinstance(this, str) and bool(_OPERATORS.search(this))
     )
 
 
 def equality(a, b) -> Expression:
     """Symbolically compute a == b."""
-    x, y = (expression(i) for i in (a, b))
+    x, y = (_expression(i) for i in (a, b))
     return x == y
 
 
 def product(a, b) -> Expression:
     """Symbolically compute a * b."""
-    x, y = (expression(i) for i in (a, b))
+    x, y = (_expression(i) for i in (a, b))
     return x * y
 
 
 def ratio(a, b) -> Expression:
     """Symbolically compute a / b."""
-    x, y = (expression(i) for i in (a, b))
+    x, y = (_expression(i) for i in (a, b))
     return x / y
 
 
+_CACHEABLE_EXPONENTS = (int, float, fractions.Fraction)
+"""Exponent types for which `~power` may cache its result."""
+
+
 def power(a, n) -> Expression:
     """Symbolically compute a ** n."""
-    return expression(a) ** n
+    if isinstance(a, str):
+        if type(n) in _CACHEABLE_EXPONENTS:
+            return _power(a, n)
+        return _raise(_parse(a), n)
+    return _raise(expression(a), n)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _power(string: str, n) -> Expression:
+    """Raise the expression that `string` represents to `n` (cached)."""
+    return _raise(_parse(string), n)
+
+
+def _raise(x: Expression, n) -> Expression:
+    """Helper for `power` and `_power`."""
+    if n == 1:
+        # Expressions are already in reduced form, so raising one to unit
+        # power would only rebuild an equal expression.
+        return x
+    return x ** n
+
+
+def _expression(this) -> Expression:
+    """Convert `this` to an expression, reusing parsed strings.
+
+    Notes
+    -----
+    Only string arguments go through the cache. Instances of
+    `~symbolic.Expression` pass through `~symbolic.expression` unchanged, and
+    other iterables may not be hashable.
+    """
+    if isinstance(this, str):
+        return _parse(this)
+    return expression(this)
@@ -1438,7 +1438,9 @@ class Expression(collections.abc.Sequence):
         If `other` is not an instance of this class, this method will first
         attempt to convert it.
         """
-        if not isinstance(other, Expression):
+        if isinstance(other, str):
+            other = parse_expression(other)
+        elif not isinstance(other, Expression):
             other = expression_factory(other)
         if len(self) != len(other):
             return False
@@ -1614,6 +1616,20 @@ def expression_factory(this, **options):
     return Expression(terms)
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_expression(string: str) -> Expression:
+    """Create an expression from `string`, with default parsing options.
+
+    Notes
+    -----
+    This function caches its results, which is safe because expressions are
+    immutable. Code that repeatedly compares expressions to, or creates
+    expressions from, the same strings (e.g., unit symbols) therefore parses
+    each string only once.
+    """
+    return expression_factory(string)
+
+
 def standard(
     this,
     missing: typing.Optional[str]=None,
@@ -4,9 +4,12 @@ import pytest
 import support
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def measurables():
-    """Implicitly measurable sequences."""
+    """Implicitly measurable sequences.
+
+    Tests in a module share these cases, so they should not modify them.
+    """
 
     unity = '1'
     unitless = [
@@ -64,15 +67,19 @@ def measurables():
             'dist': ((1.1, meter), (2.3, meter), (5.8, meter)),
         },
     ]
-    return [
+    return (
         *unitless,
         *withunit,
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def ndarrays():
-    """Base `numpy` arrays for tests."""
+    """Base `numpy` arrays for tests.
+
+    Each array is read-only so that all tests can safely share them.
+    Tests that need to modify an array should operate on a copy.
+    """
     r = [ # (3, 2)
         [+1.0, +2.0],
         [+2.0, -3.0],
@@ -108,11 +115,18 @@ def ndarrays():
         ],
     ]
     return support.NDArrays(
-        r=numpy.array(r),
-        xy=numpy.array(xy),
-        yz=numpy.array(yz),
-        zw=numpy.array(zw),
-        xyz=numpy.array(xyz),
+        r=_readonly(r),
+        xy=_readonly(xy),
+        yz=_readonly(yz),
+        zw=_readonly(zw),
+        xyz=_readonly(xyz),
     )
 
 
+def _readonly(values) -> numpy.ndarray:
+    """Create a `numpy` array that tests may share but not modify."""
+    array = numpy.array(values)
+    array.setflags(write=False)
+    return array
+
+
@@ -2,12 +2,14 @@
 Miscellaneous utilities for tests.
 """
 import contextlib
+import functools
 import numbers
 import typing
 
 import numpy
 import numpy.typing
 
+import physmet
 from physmet import measurable
 from physmet import measured
 from physmet import metric
@@ -45,6 +47,22 @@ class NDArrays(typing.NamedTuple):
     """Data that has one more dimension than all others."""
 
 
+class Tensors(typing.NamedTuple):
+    """Tensors built from `~NDArrays` for tests of binary operations."""
+    original: physmet.Tensor
+    """The reference tensor, with unit 'm'."""
+    samedims: physmet.Tensor
+    """A tensor with the same dimensions and unit as `original`."""
+    sharedim: physmet.Tensor
+    """A tensor that shares one dimension with `original`."""
+    diffdims: physmet.Tensor
+    """A tensor that shares no dimensions with `original`."""
+    diffunit: physmet.Tensor
+    """A tensor with the same data as `original` but unit 'J'."""
+    extradim: physmet.Tensor
+    """A tensor that has one more dimension than all others."""
+
+
 def operation(
     f: typing.Callable,
     a: typing.Union[numpy.typing.ArrayLike, numbers.Real],
@@ -181,6 +199,18 @@ def _compute(
     ]
 
 
+@functools.lru_cache(maxsize=None, typed=True)
+def arange(*args) -> numpy.ndarray:
+    """Create a read-only `numpy.arange` array, shared across tests.
+
+    Repeated calls with the same arguments return the same array, so tests
+    must not modify the result. Attempting to do so will raise an exception.
+    """
+    array = numpy.arange(*args)
+    array.setflags(write=False)
+    return array
+
+
 def compute_unit(f, a, b):
     """Apply `f` to the operands' unit(s)."""
     if isinstance(a, Measurement) and isinstance(b, Measurement):
@@ -1,19 +1,45 @@
 import itertools
 import numbers
+import types
 import typing
 
-import numpy
-import numpy.typing
 import pytest
 
 import physmet
+import support
+
+
+@pytest.fixture(scope='module')
+def points() -> types.SimpleNamespace:
+    """Read-only index arrays for building axes."""
+    return types.SimpleNamespace(
+        x=support.arange(4),
+        y=support.arange(5),
+        z=support.arange(1, 5),
+        w=support.arange(1, 6),
+    )
+
+
+@pytest.fixture(scope='module')
+def collections(points: types.SimpleNamespace) -> types.SimpleNamespace:
+    """Axes built from `points`, shared by tests in this module.
+
+    Axes methods return new instances, so tests may share these objects.
+    """
+    x, y, z, w = points.x, points.y, points.z, points.w
+    return types.SimpleNamespace(
+        xy=physmet.axes(x=x, y=y),
+        xz=physmet.axes(x=x, z=z),
+        xyz=physmet.axes(x=x, y=y, z=z),
+        xyzw=physmet.axes(x=x, y=y, z=z, w=w),
+    )
 
 
 def test_axes_factory():
     """Test ways to initialize axes."""
     shape = (3, 4)
     dimensions = ('x', 'y')
-    pairs = {d: numpy.arange(i) for (d, i) in zip(dimensions, shape)}
+    pairs = {d: support.arange(i) for (d, i) in zip(dimensions, shape)}
     axes = pairs.values()
     # Initialize from a shape.
     check_init_from_shape(shape)
@@ -23,27 +49,62 @@ def test_axes_factory():
     check_init_from_axes(axes, dimensions=dimensions)
     # Initialize from key-value pairs.
     check_init_from_pairs(pairs)
-    # Check error cases.
-    errors = (
+
+
+_FACTORY_SHAPE = (3, 4)
+"""The shape of axes in error cases of `physmet.axes`."""
+
+
+_FACTORY_DIMENSIONS = ('x', 'y')
+"""The dimensions of axes in error cases of `physmet.axes`."""
+
+
+_FACTORY_AXES = tuple(support.arange(i) for i in _FACTORY_SHAPE)
+"""The axis values in error cases of `physmet.axes`."""
+
+
+@pytest.mark.parametrize(
+    'args, kwargs, error',
+    [
         # cannot pass shape by position
-        ((shape,), {}, TypeError),
+        ((_FACTORY_SHAPE,), {}, TypeError),
         # cannot create axes from dimensions without shape or axes
-        ((dimensions,), {}, TypeError),
-        (dimensions, {}, TypeError),
-        ((), {'dimensions': dimensions}, TypeError),
+        ((_FACTORY_DIMENSIONS,), {}, TypeError),
+        (_FACTORY_DIMENSIONS, {}, TypeError),
+        ((), {'dimensions': _FACTORY_DIMENSIONS}, TypeError),
         # length of dimensions must equal length of shape
-        ((), {'shape': shape, 'dimensions': dimensions[:-1]}, ValueError),
+        (
+            (),
+            {
+                'shape': _FACTORY_SHAPE,
+                'dimensions': _FACTORY_DIMENSIONS[:-1],
+            },
+            ValueError,
+        ),
         # cannot pass axes by position or variable position
-        ((axes,), {}, TypeError),
-        (axes, {}, TypeError),
+        ((_FACTORY_AXES,), {}, TypeError),
+        (_FACTORY_AXES, {}, TypeError),
         # length of dimensions must equal length of axes
-        ((), {'axes': axes, 'dimensions': dimensions[:-1]}, ValueError),
+        (
+            (),
+            {
+                'axes': _FACTORY_AXES,
+                'dimensions': _FACTORY_DIMENSIONS[:-1],
+            },
+            ValueError,
+        ),
         # cannot create empty axes
         ((), {}, ValueError),
-    )
-    for args, kwargs, error in errors:
-        with pytest.raises(error):
-            physmet.axes(*args, **kwargs)
+    ],
+)
+def test_axes_factory_errors(
+    args: tuple,
+    kwargs: dict,
+    error: typing.Type[Exception],
+) -> None:
+    """Test invalid ways to initialize axes."""
+    with pytest.raises(error):
+        physmet.axes(*args, **kwargs)
 
 
 def check_init_from_shape(
@@ -61,13 +122,14 @@ def check_init_from_shape(
             physmet.axes(shape=shape),
         )
         dimensions = ('x0', 'x1')
+    expected = {n: physmet.axis.points(range(n)) for n in set(shape)}
     for axes in cases:
         assert len(axes) == len(shape)
         assert tuple(axes) == tuple(dimensions)
         for key, n in zip(dimensions, shape):
             vector = axes[key]
             assert len(vector) == n
-            assert vector == physmet.axis.points(range(n))
+            assert vector == expected[n]
 
 
 def check_init_from_axes(
@@ -82,10 +144,11 @@ def check_init_from_axes(
         these = physmet.axes(axes=axes)
     assert len(these) == len(axes)
     assert tuple(these) == tuple(dimensions)
-    for dimension, axis in zip(dimensions, axes):
+    expected = [physmet.axis.points(axis) for axis in axes]
+    for dimension, axis, points in zip(dimensions, axes, expected):
         vector = these[dimension]
         assert len(vector) == len(axis)
-        assert vector == physmet.axis.points(axis)
+        assert vector == points
 
 
 def check_init_from_pairs(pairs: dict):
@@ -101,22 +164,17 @@ def check_init_from_pairs(pairs: dict):
         physmet.axes(pairs),
         physmet.axes(pairs, **ignored)
     )
+    expected = {d: physmet.axis.points(axis) for d, axis in pairs.items()}
     for axes in cases:
         assert len(axes) == len(pairs)
         assert tuple(axes) == tuple(pairs)
-        for dimension, axis in pairs.items():
-            assert axes[dimension] == physmet.axis.points(axis)
+        for dimension, points in expected.items():
+            assert axes[dimension] == points
 
 
-def test_axes_comparisons():
+def test_axes_comparisons(collections: types.SimpleNamespace):
     """Test comparative operations between axes objects."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    w = numpy.arange(1, 6)
-    xy = physmet.axes(x=x, y=y)
-    xyz = physmet.axes(x=x, y=y, z=z)
-    xyzw = physmet.axes(x=x, y=y, z=z, w=w)
+    xy, xyz, xyzw = collections.xy, collections.xyz, collections.xyzw
     assert xy < xyz
     assert xyz > xy
     assert xyz < xyzw
@@ -129,9 +187,9 @@ def test_axes_comparisons():
 
 def test_axes_add():
     """Test the operation that fills in singular dimensions."""
-    x = numpy.arange(3)
-    y = numpy.arange(4)
-    z = numpy.arange(5)
+    x = support.arange(3)
+    y = support.arange(4)
+    z = support.arange(5)
     full = physmet.axes(x=x, y=y, z=z)
     valid = (
         (full, physmet.axes(x=[1], y=y, z=z)),
@@ -157,12 +215,9 @@ def test_axes_add():
             b + a
 
 
-def test_axes_merge():
+def test_axes_merge(points: types.SimpleNamespace):
     """Test merging operations between axes objects."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    w = numpy.arange(1, 6)
+    x, y, z, w = points.x, points.y, points.z, points.w
     axbx = physmet.axes(a=x, b=x)
     axby = physmet.axes(a=x, b=y)
     axcz = physmet.axes(a=x, c=z)
@@ -173,34 +228,32 @@ def test_axes_merge():
     assert czdw | axby != physmet.axes(a=x, b=y, c=z, d=w)
 
 
-def test_axes_copy():
+def test_axes_copy(collections: types.SimpleNamespace):
     """Test the ability to copy an axes collection."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    old = physmet.axes(x=x, y=y)
+    old = collections.xy
     new = old.copy()
     assert old == new
     assert old is not new
 
 
-def test_axes_replace():
+def test_axes_replace(
+    points: types.SimpleNamespace,
+    collections: types.SimpleNamespace,
+) -> None:
     """Test the special method for replacing an axis."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    old = physmet.axes(x=x, y=y)
+    x, z = points.x, points.z
+    old = collections.xy
     assert old.replace('y', z) == physmet.axes(x=x, y=z)
     assert old.replace('y', z=z) == physmet.axes(x=x, z=z)
 
 
-def test_axes_insert():
+def test_axes_insert(
+    points: types.SimpleNamespace,
+    collections: types.SimpleNamespace,
+) -> None:
     """Test the special method for inserting axes."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    xz = physmet.axes(x=x, z=z)
-    xy = physmet.axes(x=x, y=y)
-    xyz = physmet.axes(x=x, y=y, z=z)
+    y, z = points.y, points.z
+    xz, xy, xyz = collections.xz, collections.xy, collections.xyz
     assert xz.insert('y', y, index=1) == xyz
     assert xz.insert('y', y, before='x') == xyz
     assert xz.insert('y', y, after='z') == xyz
@@ -209,14 +262,9 @@ def test_axes_insert():
         xz.insert(index=0, before='x', after='x', y=y)
 
 
-def test_axes_without():
+def test_axes_without(collections: types.SimpleNamespace):
     """Test the special method for removing an axis."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    xy = physmet.axes(x=x, y=y)
-    xz = physmet.axes(x=x, z=z)
-    xyz = physmet.axes(x=x, y=y, z=z)
+    xy, xz, xyz = collections.xy, collections.xz, collections.xyz
     assert xyz.without('z') == xy
     assert xyz.without('y') == xz
     assert xyz.without('a') == xyz
@@ -224,14 +272,9 @@ def test_axes_without():
         xyz.without('a', strict=True)
 
 
-def test_axes_extract():
+def test_axes_extract(collections: types.SimpleNamespace):
     """Test the special method for extracting a subset of axes."""
-    x = numpy.arange(4)
-    y = numpy.arange(5)
-    z = numpy.arange(1, 5)
-    xy = physmet.axes(x=x, y=y)
-    xz = physmet.axes(x=x, z=z)
-    xyz = physmet.axes(x=x, y=y, z=z)
+    xy, xz, xyz = collections.xy, collections.xz, collections.xyz
     assert xyz.extract('x', 'y') == xy
     assert xyz.extract('x', 'z') == xz
     with pytest.raises(KeyError):
@@ -240,22 +283,30 @@ def test_axes_extract():
         xyz.extract()
 
 
-def test_axes_permute():
+_PERMUTE_NAMES = ('x', 'y', 'z')
+"""The dimensions to permute in `test_axes_permute`."""
+
+
+@pytest.mark.parametrize(
+    'permutation',
+    list(itertools.permutations(_PERMUTE_NAMES)),
+    ids='-'.join,
+)
+def test_axes_permute(
+    points: types.SimpleNamespace,
+    permutation: typing.Tuple[str, ...],
+) -> None:
     """Test the ability to permute the order of axes."""
-    mapping = {
-        'x': numpy.arange(4),
-        'y': numpy.arange(5),
-        'z': numpy.arange(1, 5),
-    }
-    names = list(mapping)
+    names = list(_PERMUTE_NAMES)
+    mapping = {k: getattr(points, k) for k in names}
     old = physmet.axes(mapping)
-    for permutation in itertools.permutations(names):
-        indices = [names.index(i) for i in permutation]
-        remapped = {k: mapping[k] for k in permutation}
-        expected = physmet.axes(remapped)
-        for order in (indices, permutation):
-            assert old.permute(order) == expected
-            assert old.permute(*order) == expected
-            assert old.permute(order=order) == expected
+    position = {name: i for i, name in enumerate(names)}
+    indices = [position[i] for i in permutation]
+    remapped = {k: mapping[k] for k in permutation}
+    expected = physmet.axes(remapped)
+    for order in (indices, permutation):
+        assert old.permute(order) == expected
+        assert old.permute(*order) == expected
+        assert old.permute(order=order) == expected
 
 
@@ -1,3 +1,5 @@
+import typing
+
 import pytest
 
 import numpy
@@ -62,6 +64,22 @@ def test_symbols():
     assert axis.symbols(['a']) | axis.symbols(['b']) == expected
 
 
+@pytest.mark.parametrize(
+    'target, error',
+    [
+        (-2.0, ValueError),
+        (0.5, ValueError),
+        (None, TypeError),
+    ],
+)
+def test_coordinates_index_errors(target, error: typing.Type[Exception]):
+    """Test invalid targets of a measured-axis index."""
+    values = [-1.0, 1.0, 1.5, 2.0, 10.1]
+    coordinates = axis.coordinates(numpy.array(values), unit='m')
+    with pytest.raises(error):
+        coordinates.index(target)
+
+
 def test_coordinates():
     """Test the representation of a measured axis."""
     values = [-1.0, 1.0, 1.5, 2.0, 10.1]
@@ -81,14 +99,6 @@ def test_coordinates():
         assert coordinates.data[index] == value
     expected = indexer.sequence([0, 2])
     assert all(coordinates.index(-100.0, 150.0, 'cm') == expected)
-    errors = [
-        (-2.0, ValueError),
-        (0.5, ValueError),
-        (None, TypeError),
-    ]
-    for target, error in errors:
-        with pytest.raises(error):
-            coordinates.index(target)
     assert coordinates.index(1.2, closest='lower') == indexer.value(1)
     assert coordinates.index(1.2, closest='upper') == indexer.value(2)
     assert coordinates.withunit('cm').index(150.0) == indexer.value(2)
@@ -1,4 +1,5 @@
 import itertools
+import typing
 
 import pytest
 
@@ -151,16 +152,31 @@ def test_dimensions_copy():
     assert new is not old
 
 
-def test_dimensions_permute():
+_PERMUTE_NAMES = ('a', 'b', 'c')
+"""The dimensions to permute in `test_dimensions_permute`."""
+
+
+@pytest.mark.parametrize(
+    'permutation',
+    list(itertools.permutations(_PERMUTE_NAMES)),
+    ids='-'.join,
+)
+def test_dimensions_permute(permutation: typing.Tuple[str, ...]):
     """Test the ability to permute the order of dimensions."""
-    names = ['a', 'b', 'c']
+    names = list(_PERMUTE_NAMES)
+    old = data.dimensions(*names)
+    position = {name: i for i, name in enumerate(names)}
+    order = [position[i] for i in permutation]
+    expected = data.dimensions(permutation)
+    assert old.permute(order) == expected
+    assert old.permute(*order) == expected
+    assert old.permute(order=order) == expected
+
+
+def test_dimensions_permute_errors():
+    """Test invalid arguments to permute the order of dimensions."""
+    names = list(_PERMUTE_NAMES)
     old = data.dimensions(*names)
-    for permutation in itertools.permutations(names):
-        order = [names.index(i) for i in permutation]
-        expected = data.dimensions(permutation)
-        assert old.permute(order) == expected
-        assert old.permute(*order) == expected
-        assert old.permute(order=order) == expected
     trivial = (0, 1, 2)
     with pytest.raises(TypeError):
         old.permute(*trivial, order=trivial)
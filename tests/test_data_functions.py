@@ -1,4 +1,5 @@
 import numpy
+import pytest
 
 import support
 from physmet import data
@@ -6,54 +7,68 @@ from physmet import indexer
 from physmet import measured
 
 
-def test_isindexlike():
-    """Test the function that checks for index-like input.
+_INDEXLIKE_TRUE = (
+    1,
+    '1',
+    numpy.array(1, dtype=int),
+    range(1, 2),
+    [1],
+    (1,),
+    numpy.array([1], dtype=int),
+    range(1, 3),
+    [1, 2],
+    (1, 2),
+    ['1', '2'],
+    ('1', '2'),
+    numpy.array([1, 2], dtype=int),
+    numpy.array([1, 2], ndmin=2),
+    numpy.array([1, 2], ndmin=3),
+    numpy.array([[1], [2]]),
+    indexer.value(1),
+    indexer.sequence([1, 2]),
+)
+"""Objects that `data.isindexlike` should accept."""
+
+
+_INDEXLIKE_FALSE = (
+    {1, 2},
+    {1: 'a', 2: 'b'},
+    slice(1, 3),
+    numpy.array([[1, 2], [3, 4]]),
+    1.0,
+    '1.0',
+    numpy.array(1, dtype=float),
+    numpy.array([1], dtype=float),
+    [1.0, 2],
+    (1.0, 2),
+    ['1.0', '2'],
+    ('1.0', '2'),
+    numpy.array([1, 2], dtype=float),
+    measured.value(2, 'm'),
+    measured.sequence([2, 3], 'm'),
+)
+"""Objects that `data.isindexlike` should reject."""
+
+
+def _case_id(case) -> str:
+    """Create a single-line test ID from the representation of `case`."""
+    return ' '.join(repr(case).split())
+
+
+@pytest.mark.parametrize('case', _INDEXLIKE_TRUE, ids=_case_id)
+def test_isindexlike_true(case):
+    """Test index-like input to `data.isindexlike`.
 
     Any instance of `~numeric.index.Object` or anything that can initialize an
-    instance of `~numeric.index.Object` should test true. Anything else should
-    test false.
+    instance of `~numeric.index.Object` should test true.
     """
-    true = [
-        1,
-        '1',
-        numpy.array(1, dtype=int),
-        range(1, 2),
-        [1],
-        (1,),
-        numpy.array([1], dtype=int),
-        range(1, 3),
-        [1, 2],
-        (1, 2),
-        ['1', '2'],
-        ('1', '2'),
-        numpy.array([1, 2], dtype=int),
-        numpy.array([1, 2], ndmin=2),
-        numpy.array([1, 2], ndmin=3),
-        numpy.array([[1], [2]]),
-        indexer.value(1),
-        indexer.sequence([1, 2]),
-    ]
-    for case in true:
-        assert data.isindexlike(case)
-    false = [
-        {1, 2},
-        {1: 'a', 2: 'b'},
-        slice(1, 3),
-        numpy.array([[1, 2], [3, 4]]),
-        1.0,
-        '1.0',
-        numpy.array(1, dtype=float),
-        numpy.array([1], dtype=float),
-        [1.0, 2],
-        (1.0, 2),
-        ['1.0', '2'],
-        ('1.0', '2'),
-        numpy.array([1, 2], dtype=float),
-        measured.value(2, 'm'),
-        measured.sequence([2, 3], 'm'),
-    ]
-    for case in false:
-        assert not data.isindexlike(case)
+    assert data.isindexlike(case)
+
+
+@pytest.mark.parametrize('case', _INDEXLIKE_FALSE, ids=_case_id)
+def test_isindexlike_false(case):
+    """Test input to `data.isindexlike` that is not index-like."""
+    assert not data.isindexlike(case)
 
 
 def test_nearest():
@@ -74,7 +89,7 @@ def test_nearest():
         found = data.nearest(values, target, bound='upper')
         assert found.index == 1
         assert found.value == 0.2
-    values = numpy.arange(3.0 * 4.0 * 5.0).reshape(3, 4, 5)
+    values = support.arange(3.0 * 4.0 * 5.0).reshape(3, 4, 5)
     found = data.nearest(values, 32.9)
     assert found.index == (1, 2, 3)
     assert found.value == 33.0
@@ -124,6 +124,20 @@ def test_sequence_factory(index_args):
     for arg in valid:
         x = indexer.sequence(arg)
         assert list(x) == [1, 2]
+    # an index sequence does not alias a writable input array
+    array = numpy.array([1, 2, 3])
+    x = indexer.sequence(array)
+    array[0] = 99
+    assert list(x) == [1, 2, 3]
+    # nor a read-only view or slice of a writable array
+    for start in (None, 1):
+        array = numpy.array([1, 2, 3])
+        readonly = array[start:]
+        readonly.setflags(write=False)
+        x = indexer.sequence(readonly)
+        expected = list(readonly)
+        array[-1] = 99
+        assert list(x) == expected
     errors = [
         # numeric sequences must have only integral elements
         ([1.0, 2], TypeError),
@@ -220,6 +234,10 @@ def test_index_shift():
     assert all(sequence.shift(-5) == indexer.sequence([5, 6]))
     assert all(sequence.shift(-5, floor=6) == indexer.sequence([6, 6]))
     assert all(sequence.shift(-5, floor=0) == indexer.sequence([5, 6]))
+    clipped = sequence.shift(+5, floor=0, ceil=15)
+    assert all(clipped == indexer.sequence([15, 15]))
+    clipped = indexer.sequence([3, 10]).shift(-5, floor=0.5)
+    assert all(clipped == indexer.sequence([0, 5]))
 
 
 def test_normalize():
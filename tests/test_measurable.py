@@ -17,6 +17,7 @@ def test_parse(measurables):
         expected = case['dist']
         assert result == expected
     assert measurable.parse(0) == (0, '1') # zero is measurable!
+    assert measurable.parse(['1_0', '2', 'm']) == (10.0, 2.0, 'm')
     with pytest.raises(measurable.ParsingTypeError):
         measurable.parse(None)
     with pytest.raises(measurable.ParsingTypeError):
@@ -310,6 +310,7 @@ def test_unit_raise():
         result = metric.unit(this) ** that
         assert isinstance(result, metric.Unit)
         assert result == metric.unit(expected)
+        assert metric.unit(this) ** that is result
 
 
 def test_unit_consistency():
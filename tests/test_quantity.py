@@ -11,6 +11,8 @@ def test_isnull():
     assert quantity.isnull(None)
     assert quantity.isnull([])
     assert quantity.isnull(())
+    assert quantity.isnull({})
+    assert not quantity.isnull([0])
     assert quantity.isnull(numpy.array([]))
     assert not quantity.isnull(0)
     assert not quantity.isnull(numpy.zeros((2, 2)))
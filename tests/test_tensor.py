@@ -1,5 +1,6 @@
 import numbers
 import operator as standard
+import types
 import typing
 
 import numpy
@@ -78,10 +79,15 @@ def test_iter():
     unit = 'm / s'
     for array in arrays:
         tensor = physmet.tensor(array, unit=unit)
-        for this, x in zip(tensor, array.flat):
-            assert isinstance(this, physmet.Scalar)
-            assert this.data == x
-            assert this.unit == unit
+        scalars = list(tensor)
+        assert all(isinstance(this, physmet.Scalar) for this in scalars)
+        values = numpy.fromiter(
+            (this.data for this in scalars),
+            dtype=array.dtype,
+            count=array.size,
+        )
+        assert numpy.array_equal(values, array.ravel())
+        assert all(this.unit == unit for this in scalars)
 
 
 def test_subscription():
@@ -124,50 +130,57 @@ def test_equality():
         assert not (a == other)
 
 
-def test_ordering():
-    """Test ordering-based comparative operations on tensors."""
+@pytest.fixture(scope='module')
+def ordered() -> typing.Dict[str, physmet.Tensor]:
+    """Tensors for testing ordering-based comparisons.
+
+    The reference tensor is `'xx'`. Other keys name tensors that have the same
+    unit and same shape (`'yx'`), the same unit and data that will broadcast
+    (`'zx'`), a different unit (`'yy'`), or data that will not broadcast
+    (`'wx'`).
+    """
     vx = numpy.array([[1.0], [10.0], [5.0]])
     vy = numpy.array([[5.0], [10.0], [1.0]])
     vz = vx[:, 0]
     vw = numpy.array([[5.0, 10.0], [1.0, 5.0]])
     ux = 'm / s'
     uy = 'J'
-    # the reference tensor
-    xx = physmet.tensor(vx, unit=ux)
-    # same unit; same shape
-    yx = physmet.tensor(vy, unit=ux)
-    # same unit; data will broadcast
-    zx = physmet.tensor(vz, unit=ux)
-    valid = [
-        (standard.lt, xx, yx),
-        (standard.le, xx, yx),
-        (standard.gt, xx, yx),
-        (standard.ge, xx, yx),
-        (standard.lt, xx, zx),
-        (standard.le, xx, zx),
-        (standard.gt, xx, zx),
-        (standard.ge, xx, zx),
-    ]
-    for f, a, b in valid:
-        r = f(a.data, b.data)
-        assert numpy.array_equal(f(a, b), physmet.tensor(r))
-    # different unit
-    yy = physmet.tensor(vy, unit=uy)
-    # data will not broadcast
-    wx = physmet.tensor(vw, unit=ux)
-    invalid = [
-        (standard.lt, xx, yy),
-        (standard.le, xx, yy),
-        (standard.gt, xx, yy),
-        (standard.ge, xx, yy),
-        (standard.lt, xx, wx),
-        (standard.le, xx, wx),
-        (standard.gt, xx, wx),
-        (standard.ge, xx, wx),
-    ]
-    for f, a, b in invalid:
-        with pytest.raises(ValueError):
-            f(a, b)
+    return {
+        'xx': physmet.tensor(vx, unit=ux),
+        'yx': physmet.tensor(vy, unit=ux),
+        'zx': physmet.tensor(vz, unit=ux),
+        'yy': physmet.tensor(vy, unit=uy),
+        'wx': physmet.tensor(vw, unit=ux),
+    }
+
+
+_ORDERING_OPERATORS = (standard.lt, standard.le, standard.gt, standard.ge)
+"""The ordering operators to test on tensors."""
+
+
+@pytest.mark.parametrize('f', _ORDERING_OPERATORS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('other', ['yx', 'zx'])
+def test_ordering(
+    ordered: typing.Dict[str, physmet.Tensor],
+    f: typing.Callable,
+    other: str,
+) -> None:
+    """Test ordering-based comparative operations on tensors."""
+    a, b = ordered['xx'], ordered[other]
+    r = f(a.data, b.data)
+    assert numpy.array_equal(f(a, b), physmet.tensor(r))
+
+
+@pytest.mark.parametrize('f', _ORDERING_OPERATORS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('other', ['yy', 'wx'])
+def test_ordering_errors(
+    ordered: typing.Dict[str, physmet.Tensor],
+    f: typing.Callable,
+    other: str,
+) -> None:
+    """Test invalid ordering-based comparative operations on tensors."""
+    with pytest.raises(ValueError):
+        f(ordered['xx'], ordered[other])
 
 
 def test_unary(ndarrays: support.NDArrays):
@@ -181,15 +194,30 @@ def test_unary(ndarrays: support.NDArrays):
         standard.neg,
     ]
     for f in operators:
-        assert f(tensor) == physmet.tensor(f(data), unit=unit)
+        result = f(tensor)
+        assert isinstance(result, physmet.Tensor)
+        assert numpy.array_equal(numpy.asarray(result), f(data))
+        assert result.unit == unit
 
 
-def test_additive(ndarrays: support.NDArrays) -> None:
-    """Test additive operations on tensors."""
+@pytest.fixture(scope='module')
+def tensors(ndarrays: support.NDArrays) -> support.Tensors:
+    """Tensors shared by tests of binary operations."""
     meter = 'm'
     joule = 'J'
-    original = physmet.tensor(ndarrays.r, unit=meter)
-    samedims = physmet.tensor(ndarrays.xy, unit=meter)
+    return support.Tensors(
+        original=physmet.tensor(ndarrays.r, unit=meter),
+        samedims=physmet.tensor(ndarrays.xy, unit=meter),
+        sharedim=physmet.tensor(ndarrays.yz, unit=meter),
+        diffdims=physmet.tensor(ndarrays.zw, unit=meter),
+        diffunit=physmet.tensor(ndarrays.r, unit=joule),
+        extradim=physmet.tensor(ndarrays.xyz, unit=meter),
+    )
+
+
+def test_additive(tensors: support.Tensors) -> None:
+    """Test additive operations on tensors."""
+    original, samedims = tensors.original, tensors.samedims
     valid = [
         # same unit; same dimensions
         (original, samedims),
@@ -199,9 +227,9 @@ def test_additive(ndarrays: support.NDArrays) -> None:
         for a, b in valid:
             check_additive(f, a, b)
             check_additive(f, b, a)
-    sharedim = physmet.tensor(ndarrays.yz, unit=meter)
-    diffdims = physmet.tensor(ndarrays.zw, unit=meter)
-    diffunit = physmet.tensor(ndarrays.r, unit=joule)
+    sharedim = tensors.sharedim
+    diffdims = tensors.diffdims
+    diffunit = tensors.diffunit
     invalid = [
         # can't add or subtract tensors with different dimensions
         (sharedim, original),
@@ -226,22 +254,20 @@ def check_additive(
     new = f(a, b)
     assert isinstance(new, physmet.Tensor)
     expected = compute(f, a, b)
-    assert numpy.array_equal(new, expected)
+    numpy.testing.assert_array_equal(new.data, expected)
     assert new.unit == a.unit
 
 
-def test_multiplicative(ndarrays: support.NDArrays) -> None:
+def test_multiplicative(tensors: support.Tensors) -> None:
     """Test multiplicative operations on tensors."""
-    meter = 'm'
-    joule = 'J'
-    original = physmet.tensor(ndarrays.r, unit=meter)
-    samedims = physmet.tensor(ndarrays.xy, unit=meter)
-    sharedim = physmet.tensor(ndarrays.yz, unit=meter)
-    diffdims = physmet.tensor(ndarrays.zw, unit=meter)
-    diffunit = physmet.tensor(ndarrays.r, unit=joule)
-    extradim = physmet.tensor(ndarrays.xyz, unit=meter)
+    original = tensors.original
+    samedims = tensors.samedims
+    sharedim = tensors.sharedim
+    diffdims = tensors.diffdims
+    diffunit = tensors.diffunit
+    extradim = tensors.extradim
     value = 2.0
-    singular = physmet.tensor([[value]], unit=meter)
+    singular = physmet.tensor([[value]], unit='m')
     operators = (
         (standard.mul, standard.mul),
         (standard.truediv, standard.truediv),
@@ -288,7 +314,7 @@ def check_multiplicative(
     new = f(a, b)
     assert isinstance(new, physmet.Tensor)
     expected = compute(f, a, b)
-    assert numpy.array_equal(new, expected)
+    numpy.testing.assert_array_equal(new.data, expected)
     if isinstance(a, numbers.Real):
         unit = g('1', b.unit)
     elif isinstance(b, numbers.Real):
@@ -298,52 +324,77 @@ def check_multiplicative(
     assert new.unit == unit
 
 
-def test_pow(ndarrays: support.NDArrays) -> None:
-    """Test exponentiation on a tensor."""
-    meter = 'm'
-    joule = 'J'
-    original = physmet.tensor(ndarrays.r, unit=meter)
-    p = 3
-    unitless = physmet.tensor(ndarrays.r)
-    valid = [
+@pytest.fixture(scope='module')
+def pow_operands(
+    ndarrays: support.NDArrays,
+    tensors: support.Tensors,
+) -> types.SimpleNamespace:
+    """Operands for testing exponentiation on tensors."""
+    return types.SimpleNamespace(
+        **tensors._asdict(),
+        unitless=physmet.tensor(ndarrays.r),
+        number=3,
+        string='1',
+        array=tensors.original.data,
+    )
+
+
+@pytest.mark.parametrize(
+    'a, b, t',
+    [
         # can raise a tensor by a number
-        (original, p, physmet.Tensor),
+        ('original', 'number', physmet.Tensor),
         # can raise a unitless tensor by a unitless tensor
-        (unitless, unitless, physmet.Tensor),
+        ('unitless', 'unitless', physmet.Tensor),
         # can raise a number by a unitless tensor
-        (p, unitless, numpy.ndarray),
+        ('number', 'unitless', numpy.ndarray),
         # can raise a numpy array by a unitless tensor
-        (original.data, unitless, numpy.ndarray)
-    ]
-    for a, b, t in valid:
-        check_pow(standard.pow, a, b, t)
-    samedims = physmet.tensor(ndarrays.xy, unit=meter)
-    sharedim = physmet.tensor(ndarrays.yz, unit=meter)
-    diffdims = physmet.tensor(ndarrays.zw, unit=meter)
-    diffunit = physmet.tensor(ndarrays.r, unit=joule)
-    extradim = physmet.tensor(ndarrays.xyz, unit=meter)
-    invalid = [
+        ('array', 'unitless', numpy.ndarray),
+    ],
+)
+def test_pow(
+    pow_operands: types.SimpleNamespace,
+    a: str,
+    b: str,
+    t: type,
+) -> None:
+    """Test exponentiation on a tensor."""
+    x, y = getattr(pow_operands, a), getattr(pow_operands, b)
+    check_pow(standard.pow, x, y, t)
+
+
+@pytest.mark.parametrize(
+    'a, b, error',
+    [
         # a non-numeric exponent is meaningless
-        (original, '1', TypeError),
+        ('original', 'string', TypeError),
         # cannot raise a unitful tensor by even a unitless tensor
-        (original, unitless, ValueError),
+        ('original', 'unitless', ValueError),
         # cannot raise anything by a unitful tensor
-        (p, original, ValueError),
-        (original.data, original, ValueError),
-        (original, samedims, ValueError),
-        (samedims, original, ValueError),
-        (original, sharedim, ValueError),
-        (sharedim, original, ValueError),
-        (original, diffdims, ValueError),
-        (diffdims, original, ValueError),
-        (original, diffunit, ValueError),
-        (diffunit, original, ValueError),
-        (original, extradim, ValueError),
-        (extradim, original, ValueError),
-    ]
-    for a, b, error in invalid:
-        with pytest.raises(error):
-            a ** b
+        ('number', 'original', ValueError),
+        ('array', 'original', ValueError),
+        ('original', 'samedims', ValueError),
+        ('samedims', 'original', ValueError),
+        ('original', 'sharedim', ValueError),
+        ('sharedim', 'original', ValueError),
+        ('original', 'diffdims', ValueError),
+        ('diffdims', 'original', ValueError),
+        ('original', 'diffunit', ValueError),
+        ('diffunit', 'original', ValueError),
+        ('original', 'extradim', ValueError),
+        ('extradim', 'original', ValueError),
+    ],
+)
+def test_pow_errors(
+    pow_operands: types.SimpleNamespace,
+    a: str,
+    b: str,
+    error: typing.Type[Exception],
+) -> None:
+    """Test invalid exponentiation on a tensor."""
+    x, y = getattr(pow_operands, a), getattr(pow_operands, b)
+    with pytest.raises(error):
+        x ** y
 
 
 def check_pow(
@@ -357,7 +408,7 @@ def check_pow(
     assert isinstance(new, t)
     if isinstance(new, physmet.Tensor):
         expected = compute(f, a, b)
-        assert numpy.array_equal(new, expected)
+        numpy.testing.assert_array_equal(new.data, expected)
         if a.isunitless:
             assert new.unit == '1'
         else:
@@ -373,31 +424,49 @@ def compute(
     """Compute the result of `f(a, b)`."""
     if all(not isinstance(i, physmet.Tensor) for i in (a, b)):
         raise TypeError("Expected at least one of a or b to be a tensor")
-    if isinstance(b, typing.SupportsFloat):
+    if not isinstance(b, physmet.Tensor):
         return f(a.data, float(b))
-    if isinstance(a, typing.SupportsFloat):
+    if not isinstance(a, physmet.Tensor):
         return f(float(a), b.data)
     return f(a.data, b.data)
 
 
-def test_trig(ndarrays: support.NDArrays):
+@pytest.fixture(scope='module')
+def angles(ndarrays: support.NDArrays) -> typing.Dict[str, physmet.Tensor]:
+    """Tensors of the reference data in angular and non-angular units."""
+    return {
+        unit: physmet.tensor(ndarrays.r, unit=unit)
+        for unit in ('rad', 'deg', 'm')
+    }
+
+
+_TRIG_FUNCTIONS = (numpy.sin, numpy.cos, numpy.tan)
+"""The trigonometric ufuncs to test on tensors."""
+
+
+@pytest.mark.parametrize('f', _TRIG_FUNCTIONS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('unit', ['rad', 'deg'])
+def test_trig(
+    angles: typing.Dict[str, physmet.Tensor],
+    f: typing.Callable,
+    unit: str,
+) -> None:
     """Test `numpy` trigonometric ufuncs on a tensor."""
-    for f in (numpy.sin, numpy.cos, numpy.tan):
-        for unit in {'rad', 'deg'}:
-            old = physmet.tensor(
-                ndarrays.r,
-                unit=unit,
-            )
-            new = f(old)
-            assert isinstance(new, physmet.Tensor)
-            assert numpy.array_equal(new, f(old.data))
-            assert new.unit == '1'
-        bad = physmet.tensor(
-            ndarrays.r,
-            unit='m',
-        )
-        with pytest.raises(ValueError):
-            f(bad)
+    old = angles[unit]
+    new = f(old)
+    assert isinstance(new, physmet.Tensor)
+    assert numpy.array_equal(new, f(old.data))
+    assert new.unit == '1'
+
+
+@pytest.mark.parametrize('f', _TRIG_FUNCTIONS, ids=lambda f: f.__name__)
+def test_trig_errors(
+    angles: typing.Dict[str, physmet.Tensor],
+    f: typing.Callable,
+) -> None:
+    """Trigonometric ufuncs should require an angular unit."""
+    with pytest.raises(ValueError):
+        f(angles['m'])
 
 
 def test_sqrt(ndarrays: support.NDArrays):
@@ -424,79 +493,95 @@ def test_squeeze(ndarrays: support.NDArrays):
     assert scalar.unit == singular.unit
 
 
-def test_axis_mean():
-    """Test `numpy.mean` along an axis of a tensor."""
+@pytest.fixture(scope='module')
+def arange345() -> typing.Tuple[numpy.ndarray, physmet.Tensor]:
+    """A read-only (3, 4, 5) array and the tensor that wraps it.
+
+    Tests in this module share these objects, so they should not modify them.
+    """
     data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    unit = 'm'
-    old = physmet.tensor(data, unit=unit)
-    for axis in range(data.ndim):
-        for a in (axis, axis-old.ndim):
-            new = numpy.mean(old, axis=a)
-            assert isinstance(new, physmet.Tensor)
-            assert numpy.array_equal(new, numpy.mean(data, axis=a))
-            assert new.unit == old.unit
+    data.setflags(write=False)
+    return data, physmet.tensor(data, unit='m')
+
 
+_AXES = (0, 1, 2, -3, -2, -1)
+"""Axes of the shared (3, 4, 5) tensor to test, from both ends."""
 
-def test_full_mean():
+
+@pytest.mark.parametrize('a', _AXES)
+def test_axis_mean(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+    a: int,
+) -> None:
+    """Test `numpy.mean` along an axis of a tensor."""
+    data, old = arange345
+    new = numpy.mean(old, axis=a)
+    assert isinstance(new, physmet.Tensor)
+    assert numpy.array_equal(new, numpy.mean(data, axis=a))
+    assert new.unit == old.unit
+
+
+def test_full_mean(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+) -> None:
     """Test `numpy.mean` of a full tensor."""
-    data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    old = physmet.tensor(data, unit='m')
+    data, old = arange345
     new = numpy.mean(old)
     assert isinstance(new, physmet.Scalar)
     assert numpy.array_equal(new.data, numpy.mean(data))
     assert new.unit == old.unit
 
 
-def test_axis_sum():
+@pytest.mark.parametrize('a', _AXES)
+def test_axis_sum(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+    a: int,
+) -> None:
     """Test `numpy.sum` along an axis of a tensor."""
-    data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    unit = 'm'
-    old = physmet.tensor(data, unit=unit)
-    for axis in range(data.ndim):
-        for a in (axis, axis-old.ndim):
-            new = numpy.sum(old, axis=a)
-            assert isinstance(new, physmet.Tensor)
-            assert numpy.array_equal(new, numpy.sum(data, axis=a))
+    data, old = arange345
+    new = numpy.sum(old, axis=a)
+    assert isinstance(new, physmet.Tensor)
+    assert numpy.array_equal(new, numpy.sum(data, axis=a))
 
 
-def test_full_sum():
+def test_full_sum(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+) -> None:
     """Test `numpy.sum` of a full tensor."""
-    data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    old = physmet.tensor(data, unit='m')
+    data, old = arange345
     new = numpy.sum(old)
     assert isinstance(new, physmet.Scalar)
     assert numpy.array_equal(new.data, numpy.sum(data))
     assert new.unit == old.unit
 
 
-def test_axis_cumsum():
+@pytest.mark.parametrize('a', _AXES)
+def test_axis_cumsum(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+    a: int,
+) -> None:
     """Test `numpy.cumsum` along an axis of a tensor."""
-    data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    unit = 'm'
-    old = physmet.tensor(data, unit=unit)
-    for axis in range(data.ndim):
-        for a in (axis, axis-old.ndim):
-            new = numpy.cumsum(old, axis=a)
-            assert isinstance(new, physmet.Tensor)
-            assert numpy.array_equal(new, numpy.cumsum(data, axis=a))
-            assert new.unit == old.unit
+    data, old = arange345
+    new = numpy.cumsum(old, axis=a)
+    assert isinstance(new, physmet.Tensor)
+    assert numpy.array_equal(new, numpy.cumsum(data, axis=a))
+    assert new.unit == old.unit
 
 
-def test_full_cumsum():
+def test_full_cumsum(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+) -> None:
     """Test `numpy.cumsum` of a full tensor."""
-    data = 1 + numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    old = physmet.tensor(data, unit='m')
+    data, old = arange345
     new = numpy.cumsum(old)
     assert isinstance(new, physmet.Vector)
     assert numpy.array_equal(new.data, numpy.cumsum(data))
     assert new.unit == old.unit
 
 
-def test_transpose():
-    """Test `numpy.transpose` on a tensor."""
-    data = numpy.arange(3 * 4 * 5).reshape(3, 4, 5)
-    old = physmet.tensor(data, unit='cm')
-    test = [
+@pytest.mark.parametrize(
+    'axes',
+    [
         (0, 1, 2),
         (0, 2, 1),
         (1, 2, 0),
@@ -504,16 +589,31 @@ def test_transpose():
         (2, 0, 1),
         (2, 1, 0),
         None,
-    ]
-    for axes in test:
-        new = numpy.transpose(old, axes=axes)
-        assert isinstance(new, physmet.Tensor)
-        assert numpy.array_equal(new.data, numpy.transpose(data, axes=axes))
-        assert new.unit == old.unit
+    ],
+)
+def test_transpose(
+    arange345: typing.Tuple[numpy.ndarray, physmet.Tensor],
+    axes: typing.Optional[typing.Tuple[int, ...]],
+) -> None:
+    """Test `numpy.transpose` on a tensor."""
+    data, old = arange345
+    new = numpy.transpose(old, axes=axes)
+    assert isinstance(new, physmet.Tensor)
+    assert numpy.array_equal(new.data, numpy.transpose(data, axes=axes))
+    assert new.unit == old.unit
+    # Transposing should not copy the data.
+    assert numpy.shares_memory(new.data, old.data)
 
 
-def test_gradient(ndarrays: support.NDArrays):
-    """Test `numpy.gradient` on a tensor."""
+@pytest.fixture(scope='module')
+def gradient_cases(
+    ndarrays: support.NDArrays,
+) -> typing.Tuple[physmet.Tensor, typing.List[dict]]:
+    """A tensor and cases for testing `numpy.gradient` on it.
+
+    Each case includes the reference gradient(s), so tests in this module
+    compute them only once.
+    """
     data = ndarrays.r
     tensor = physmet.tensor(data, unit='m')
     cases = [
@@ -539,6 +639,14 @@ def test_gradient(ndarrays: support.NDArrays):
             'reference': [numpy.gradient(data, [0.5, 1.0, 1.5], axis=0)],
         },
     ]
+    return tensor, cases
+
+
+def test_gradient(
+    gradient_cases: typing.Tuple[physmet.Tensor, typing.List[dict]],
+) -> None:
+    """Test `numpy.gradient` on a tensor."""
+    tensor, cases = gradient_cases
     for case in cases:
         dt = case.get('dt', [])
         gradient = numpy.gradient(tensor, *dt, axis=case.get('axis'))
@@ -546,10 +654,12 @@ def test_gradient(ndarrays: support.NDArrays):
         reference = case['reference']
         expected = reference if isinstance(reference, list) else [reference]
         unit = case['unit']
-        for this, that in zip(computed, expected):
-            assert isinstance(this, physmet.Tensor)
-            assert numpy.array_equal(this, that)
-            assert this.unit == unit
+        assert all(isinstance(this, physmet.Tensor) for this in computed)
+        numpy.testing.assert_array_equal(
+            numpy.stack([this.data for this in computed]),
+            numpy.stack(expected),
+        )
+        assert all(this.unit == unit for this in computed)
 
 
 def test_unit():
@@ -1,5 +1,6 @@
 import numbers
 import operator as standard
+import types
 import typing
 
 import numpy
@@ -16,14 +17,18 @@ from physmet import numeric
 import support
 
 
-@pytest.fixture
-def values():
-    return [1.0, 10.0, -5.0]
+@pytest.fixture(scope='module')
+def values() -> typing.Tuple[float, ...]:
+    """Reference values, shared by tests in this module."""
+    return (1.0, 10.0, -5.0)
 
 
-@pytest.fixture
-def array(values: typing.List[float]):
-    return numpy.array(values)
+@pytest.fixture(scope='module')
+def array(values: typing.Tuple[float, ...]) -> numpy.ndarray:
+    """A read-only array of the reference values."""
+    a = numpy.array(values)
+    a.setflags(write=False)
+    return a
 
 
 def test_factory():
@@ -88,10 +93,15 @@ def test_iter():
     data = numpy.array([1.5, 3.0, -1.5, -3.0])
     unit = 'm / s'
     vector = physmet.vector(data, unit=unit)
-    for this, x in zip(vector, data):
-        assert isinstance(this, physmet.Scalar)
-        assert this.data == x
-        assert this.unit == unit
+    scalars = list(vector)
+    assert all(isinstance(this, physmet.Scalar) for this in scalars)
+    values = numpy.fromiter(
+        (this.data for this in scalars),
+        dtype=data.dtype,
+        count=data.size,
+    )
+    assert numpy.array_equal(values, data)
+    assert all(this.unit == unit for this in scalars)
 
 
 def test_subscription():
@@ -107,11 +117,11 @@ def test_subscription():
     assert scalar.unit == original.unit
 
 
-def test_equality(array: numpy.ndarray):
+def test_equality(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test equality-based comparative operations on vectors."""
     unit = 'm'
     # the reference vector
-    a = physmet.vector(array, unit=unit)
+    a = meter_vector
     # directly test "equal" via __eq__
     assert a == physmet.vector(array, unit=unit)
     unequal = [
@@ -159,10 +169,10 @@ def test_ordering(array: numpy.ndarray):
             f(a, b)
 
 
-def test_unary(array: numpy.ndarray):
+def test_unary(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test unary numerical operations on vectors."""
     unit = 'm'
-    vector = physmet.vector(array, unit=unit)
+    vector = meter_vector
     operators = [
         abs,
         standard.pos,
@@ -172,36 +182,77 @@ def test_unary(array: numpy.ndarray):
         assert f(vector) == physmet.vector(f(array), unit=unit)
 
 
-def test_additive(array: numpy.ndarray, values: typing.List[float]) -> None:
+@pytest.fixture(scope='module')
+def meter_vector(array: numpy.ndarray) -> physmet.Vector:
+    """The reference vector, with unit 'm'.
+
+    Operations on vectors return new instances, so tests may share this one.
+    """
+    return physmet.vector(array, unit='m')
+
+
+@pytest.fixture(scope='module')
+def operands(
+    meter_vector: physmet.Vector,
+    array: numpy.ndarray,
+    values: typing.Tuple[float, ...],
+) -> types.SimpleNamespace:
+    """Operands for testing binary arithmetic on vectors.
+
+    The reference vector is `original`, which has unit 'm'. Tuples of values
+    followed by a unit represent implicitly measurable operands.
+    """
+    meter = metric.unit('m')
+    joule = metric.unit('J')
+    return types.SimpleNamespace(
+        original=meter_vector,
+        sameunit=physmet.vector(array, unit=meter),
+        diffunit=physmet.vector(array, unit=joule),
+        singular=physmet.vector([2.0], unit=meter),
+        value=2.0,
+        pair=(values[0], meter),
+        tuple=(*values, meter),
+        pair_joule=(values[0], joule),
+        tuple_joule=(*values, joule),
+        unitless=physmet.vector(array),
+        number=3,
+        string='1',
+        array=meter_vector.data,
+    )
+
+
+_ADDITIVE_OPERATORS = (standard.add, standard.sub)
+"""The additive operators to test on vectors."""
+
+
+@pytest.mark.parametrize('f', _ADDITIVE_OPERATORS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('b', ['sameunit', 'pair', 'tuple'])
+def test_additive(
+    operands: types.SimpleNamespace,
+    f: typing.Callable,
+    b: str,
+) -> None:
     """Test additive operations on vectors."""
-    meter = 'm'
-    joule = 'J'
-    original = physmet.vector(array, unit=meter)
-    sameunit = physmet.vector(array, unit=meter)
-    valid = [
-        # same unit
-        (original, sameunit, original.unit),
-        (original, (values[0], original.unit), original.unit),
-        (original, (*values, original.unit), original.unit),
-    ]
-    operators = (standard.add, standard.sub)
-    for f in operators:
-        for a, b, u in valid:
-            check_additive(f, a, b, u)
-            check_additive(f, b, a, u)
-    diffunit = physmet.vector(array, unit=joule)
-    invalid = [
-        # can't add or subtract vectors with different units
-        (diffunit, original),
-        (diffunit, (1.0, original.unit)),
-        (diffunit, (1.0, 2.0, 3.0, original.unit)),
-    ]
-    for f in operators:
-        for a, b in invalid:
-            with pytest.raises(ValueError):
-                f(a, b)
-            with pytest.raises(ValueError):
-                f(b, a)
+    original = operands.original
+    other = getattr(operands, b)
+    check_additive(f, original, other, original.unit)
+    check_additive(f, other, original, original.unit)
+
+
+@pytest.mark.parametrize('f', _ADDITIVE_OPERATORS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('b', ['original', 'pair', 'tuple'])
+def test_additive_errors(
+    operands: types.SimpleNamespace,
+    f: typing.Callable,
+    b: str,
+) -> None:
+    """Can't add or subtract vectors with different units."""
+    diffunit = operands.diffunit
+    other = getattr(operands, b)
+    with pytest.raises(ValueError):
+        f(diffunit, other)
+    with pytest.raises(ValueError):
+        f(other, diffunit)
 
 
 def check_additive(f, a, b, unit: metric.UnitLike) -> None:
@@ -210,93 +261,119 @@ def check_additive(f, a, b, unit: metric.UnitLike) -> None:
     assert isinstance(new, physmet.Vector)
     x = support.getdata(a)
     y = support.getdata(b)
-    assert numpy.array_equal(new.data, f(x, y))
+    numpy.testing.assert_array_equal(new.data, f(x, y))
     assert new.unit == unit
 
 
-def test_multiplicative(array: numpy.ndarray, values: typing.List[float]):
+_MULTIPLICATIVE_OPERATORS = (
+    (standard.mul, standard.mul),
+    (standard.truediv, standard.truediv),
+    (standard.floordiv, standard.truediv),
+    (standard.mod, standard.truediv),
+)
+"""Pairs of multiplicative operators to test and their unit operators."""
+
+
+_MULTIPLICATIVE_OPERANDS = (
+    ('original', 'sameunit'),
+    ('original', 'diffunit'),
+    ('original', 'singular'),
+    ('original', 'value'),
+    ('singular', 'singular'),
+    ('original', 'pair'),
+    ('original', 'tuple'),
+    ('original', 'pair_joule'),
+    ('original', 'tuple_joule'),
+)
+"""Names of valid operands in multiplicative operations on vectors."""
+
+
+@pytest.mark.parametrize(
+    'f, g',
+    _MULTIPLICATIVE_OPERATORS,
+    ids=lambda f: f.__name__,
+)
+@pytest.mark.parametrize('a, b', _MULTIPLICATIVE_OPERANDS)
+def test_multiplicative(
+    operands: types.SimpleNamespace,
+    f: typing.Callable,
+    g: typing.Callable,
+    a: str,
+    b: str,
+) -> None:
     """Test multiplicative operations on vectors."""
-    meter = 'm'
-    joule = 'J'
-    original = physmet.vector(array, unit=meter)
-    sameunit = physmet.vector(array, unit=meter)
-    diffunit = physmet.vector(array, unit=joule)
-    value = 2.0
-    singular = physmet.vector([value], unit=meter)
-    operators = (
-        (standard.mul, standard.mul),
-        (standard.truediv, standard.truediv),
-        (standard.floordiv, standard.truediv),
-        (standard.mod, standard.truediv),
-    )
-    valid = [
-        (original, sameunit),
-        (original, diffunit),
-        (original, singular),
-        (original, value),
-        (singular, singular),
-        (original, (values[0], original.unit)),
-        (original, (*values, original.unit)),
-        (original, (values[0], diffunit.unit)),
-        (original, (*values, diffunit.unit)),
-    ]
-    for f, g in operators:
-        for a, b in valid:
-            check_multiplicative(f, g, a, b)
-            check_multiplicative(f, g, b, a)
+    x, y = getattr(operands, a), getattr(operands, b)
+    for p, q in ((x, y), (y, x)):
+        unit = support.compute_unit(g, p, q)
+        check_multiplicative(f, p, q, unit)
 
 
 def check_multiplicative(
     f: typing.Callable,
-    g: typing.Callable,
     a: typing.Union[physmet.Vector, numbers.Real, tuple],
     b: typing.Union[physmet.Vector, numbers.Real, tuple],
+    unit: metric.UnitLike,
 ) -> None:
     """Helper for `test_multiplicative`."""
     new = f(a, b)
     assert isinstance(new, physmet.Vector)
     x = support.getdata(a)
     y = support.getdata(b)
-    assert numpy.array_equal(new.data, f(x, y))
-    unit = support.compute_unit(g, a, b)
+    numpy.testing.assert_array_equal(new.data, f(x, y))
     assert new.unit == unit
 
 
-def test_pow(array: numpy.ndarray) -> None:
+_POW_VALID = (
+    # can raise a vector by a number
+    ('original', 'number', physmet.Vector),
+    # can raise a unitless vector by a unitless vector
+    ('unitless', 'unitless', physmet.Vector),
+    # can raise a number by a unitless vector
+    ('number', 'unitless', numpy.ndarray),
+    # can raise a numpy array by a unitless vector
+    ('array', 'unitless', numpy.ndarray),
+)
+"""Names of valid operands in exponentiation, with the result type."""
+
+
+_POW_INVALID = (
+    # a non-numeric exponent is meaningless
+    ('original', 'string', TypeError),
+    # cannot raise a unitful vector by even a unitless vector
+    ('original', 'unitless', ValueError),
+    # cannot raise anything by a unitful vector
+    ('number', 'original', ValueError),
+    ('array', 'original', ValueError),
+    ('original', 'original', ValueError),
+    ('original', 'diffunit', ValueError),
+    ('diffunit', 'original', ValueError),
+)
+"""Names of invalid operands in exponentiation, with the expected error."""
+
+
+@pytest.mark.parametrize('a, b, t', _POW_VALID)
+def test_pow(
+    operands: types.SimpleNamespace,
+    a: str,
+    b: str,
+    t: type,
+) -> None:
     """Test exponentiation on a vector."""
-    meter = 'm'
-    joule = 'J'
-    original = physmet.vector(array, unit=meter)
-    p = 3
-    unitless = physmet.vector(array)
-    valid = [
-        # can raise a vector by a number
-        (original, p, physmet.Vector),
-        # can raise a unitless vector by a unitless vector
-        (unitless, unitless, physmet.Vector),
-        # can raise a number by a unitless vector
-        (p, unitless, numpy.ndarray),
-        # can raise a numpy array by a unitless vector
-        (original.data, unitless, numpy.ndarray)
-    ]
-    for a, b, t in valid:
-        check_pow(standard.pow, a, b, t)
-    diffunit = physmet.vector(array, unit=joule)
-    invalid = [
-        # a non-numeric exponent is meaningless
-        (original, '1', TypeError),
-        # cannot raise a unitful vector by even a unitless vector
-        (original, unitless, ValueError),
-        # cannot raise anything by a unitful vector
-        (p, original, ValueError),
-        (original.data, original, ValueError),
-        (original, original, ValueError),
-        (original, diffunit, ValueError),
-        (diffunit, original, ValueError),
-    ]
-    for a, b, error in invalid:
-        with pytest.raises(error):
-            a ** b
+    x, y = getattr(operands, a), getattr(operands, b)
+    check_pow(standard.pow, x, y, t)
+
+
+@pytest.mark.parametrize('a, b, error', _POW_INVALID)
+def test_pow_errors(
+    operands: types.SimpleNamespace,
+    a: str,
+    b: str,
+    error: typing.Type[Exception],
+) -> None:
+    """Test invalid exponentiation on a vector."""
+    x, y = getattr(operands, a), getattr(operands, b)
+    with pytest.raises(error):
+        x ** y
 
 
 def check_pow(
@@ -310,7 +387,7 @@ def check_pow(
     assert isinstance(new, t)
     if isinstance(new, physmet.Vector):
         expected = compute(f, a, b)
-        assert numpy.array_equal(new, expected)
+        numpy.testing.assert_array_equal(new.data, expected)
         if a.isunitless:
             assert new.unit == '1'
         else:
@@ -333,18 +410,42 @@ def compute(
     return f(a.data, b.data)
 
 
-def test_trig(array: numpy.ndarray):
+@pytest.fixture(scope='module')
+def angles(array: numpy.ndarray) -> typing.Dict[str, physmet.Vector]:
+    """Vectors of the reference data in angular and non-angular units."""
+    return {
+        unit: physmet.vector(array, unit=unit)
+        for unit in ('rad', 'deg', 'm')
+    }
+
+
+_TRIG_FUNCTIONS = (numpy.sin, numpy.cos, numpy.tan)
+"""The trigonometric ufuncs to test on vectors."""
+
+
+@pytest.mark.parametrize('f', _TRIG_FUNCTIONS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize('unit', ['rad', 'deg'])
+def test_trig(
+    angles: typing.Dict[str, physmet.Vector],
+    array: numpy.ndarray,
+    f: typing.Callable,
+    unit: str,
+) -> None:
     """Test `numpy` trigonometric ufuncs on a vector."""
-    for f in (numpy.sin, numpy.cos, numpy.tan):
-        for unit in {'rad', 'deg'}:
-            old = physmet.vector(array, unit=unit)
-            new = f(old)
-            assert isinstance(new, physmet.Vector)
-            assert numpy.array_equal(new, f(old.data))
-            assert new.unit == '1'
-        bad = physmet.vector(array, unit='m')
-        with pytest.raises(ValueError):
-            f(bad)
+    new = f(angles[unit])
+    assert isinstance(new, physmet.Vector)
+    numpy.testing.assert_array_equal(new.data, f(array))
+    assert new.unit == '1'
+
+
+@pytest.mark.parametrize('f', _TRIG_FUNCTIONS, ids=lambda f: f.__name__)
+def test_trig_errors(
+    angles: typing.Dict[str, physmet.Vector],
+    f: typing.Callable,
+) -> None:
+    """Trigonometric ufuncs should require an angular unit."""
+    with pytest.raises(ValueError):
+        f(angles['m'])
 
 
 def test_sqrt(array: numpy.ndarray):
@@ -353,16 +454,16 @@ def test_sqrt(array: numpy.ndarray):
     old = physmet.vector(data, unit='m')
     new = numpy.sqrt(old)
     assert isinstance(new, physmet.Vector)
-    assert numpy.array_equal(new, numpy.sqrt(data))
+    numpy.testing.assert_array_equal(new.data, numpy.sqrt(data))
     assert new.unit == f"{old.unit}^1/2"
 
 
-def test_squeeze(array: numpy.ndarray):
+def test_squeeze(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test `numpy.squeeze` on a vector."""
-    old = physmet.vector(array, unit='m')
+    old = meter_vector
     new = numpy.squeeze(old)
     assert isinstance(new, physmet.Vector)
-    assert numpy.array_equal(new, numpy.squeeze(array))
+    numpy.testing.assert_array_equal(new.data, numpy.squeeze(array))
     assert new.unit == old.unit
     singular = physmet.vector([2.0], unit='m')
     scalar = numpy.squeeze(singular)
@@ -370,30 +471,30 @@ def test_squeeze(array: numpy.ndarray):
     assert scalar.unit == singular.unit
 
 
-def test_mean(array: numpy.ndarray):
+def test_mean(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test `numpy.mean` of a vector."""
-    old = physmet.vector(array, unit='m')
+    old = meter_vector
     new = numpy.mean(old)
     assert isinstance(new, physmet.Scalar)
     assert numpy.array_equal(new.data, numpy.mean(array))
     assert new.unit == old.unit
 
 
-def test_sum(array: numpy.ndarray):
+def test_sum(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test `numpy.sum` of a vector."""
-    old = physmet.vector(array, unit='m')
+    old = meter_vector
     new = numpy.sum(old)
     assert isinstance(new, physmet.Scalar)
     assert numpy.array_equal(new.data, numpy.sum(array))
     assert new.unit == old.unit
 
 
-def test_cumsum(array: numpy.ndarray):
+def test_cumsum(meter_vector: physmet.Vector, array: numpy.ndarray):
     """Test `numpy.cumsum` of a vector."""
-    old = physmet.vector(array, unit='m')
+    old = meter_vector
     new = numpy.cumsum(old)
     assert isinstance(new, physmet.Vector)
-    assert numpy.array_equal(new.data, numpy.cumsum(array))
+    numpy.testing.assert_array_equal(new.data, numpy.cumsum(array))
     assert new.unit == old.unit
 
 
@@ -402,31 +503,48 @@ def test_transpose(array: numpy.ndarray):
     old = physmet.vector(array, unit='cm')
     new = numpy.transpose(old)
     assert isinstance(new, physmet.Vector)
-    assert numpy.array_equal(new.data, numpy.transpose(array))
+    numpy.testing.assert_array_equal(new.data, numpy.transpose(array))
     assert new.unit == old.unit
 
 
-def test_gradient(array: numpy.ndarray):
-    """Test `numpy.gradient` on a vector."""
-    vector = physmet.vector(array, unit='m')
-    cases = [
+@pytest.fixture(scope='module')
+def gradient_cases(
+    meter_vector: physmet.Vector,
+    array: numpy.ndarray,
+) -> typing.List[dict]:
+    """Cases for testing `numpy.gradient` on the reference vector.
+
+    Cases with equivalent steps share a single reference gradient.
+    """
+    unit = meter_vector.unit
+    uniform = numpy.gradient(array)
+    halved = numpy.gradient(array, 0.5)
+    return [
         {
             'dt': [],
-            'unit': vector.unit,
-            'reference': numpy.gradient(array),
+            'unit': unit,
+            'reference': uniform,
         },
         {
             'dt': [0.5],
-            'unit': vector.unit,
-            'reference': numpy.gradient(array, 0.5),
+            'unit': unit,
+            'reference': halved,
         },
         {
             'dt': [physmet.scalar(0.5, unit='s')],
-            'unit': vector.unit / 's',
-            'reference': numpy.gradient(array, 0.5),
+            'unit': unit / 's',
+            'reference': halved,
         },
     ]
-    for case in cases:
+
+
+def test_gradient(
+    meter_vector: physmet.Vector,
+    gradient_cases: typing.List[dict],
+) -> None:
+    """Test `numpy.gradient` on a vector."""
+    vector = meter_vector
+    for case in gradient_cases:
         dt = case.get('dt', [])
         gradient = numpy.gradient(vector, *dt, axis=case.get('axis'))
         computed = gradient if isinstance(gradient, list) else [gradient]
@@ -447,7 +565,8 @@ def test_unit():
     assert new is not old
     assert new.unit == 'km'
     factor = old.unit >> new.unit
-    assert numpy.array_equal(new, factor*numpy.array(old))
+    assert numpy.array_equal(new.data, factor*old.data)
+    assert not numpy.shares_memory(new.data, old.data)
     with pytest.raises(ValueError):
         old.withunit('J')
 